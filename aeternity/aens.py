@@ -3,6 +3,8 @@ from aeternity.openapi import OpenAPIClientException
 from aeternity import defaults, identifiers, hashing, utils, transactions
 
 import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 class NameStatus:
@@ -16,6 +18,21 @@ class NameStatus:
 
 class AEName:
     Status = NameStatus
+    # avoid the per instance __dict__ when managing many names
+    __slots__ = (
+        'client',
+        'domain',
+        '_domain_bytes',
+        'name_id',
+        'status',
+        'preclaimed_block_height',
+        'preclaimed_tx_block_height',
+        'preclaimed_tx_hash',
+        'preclaimed_commitment_hash',
+        'preclaim_salt',
+        'name_ttl',
+        'pointers',
+    )
 
     def __init__(self, domain, client):
 
@@ -24,10 +41,14 @@ class AEName:
 
         self.client = client
         self.domain = domain.lower()
+        # the encoded domain is used to compute the commitment id
+        self._domain_bytes = self.domain.encode('utf8')
         self.name_id = hashing.name_id(domain)
         self.status = NameStatus.UNKNOWN
         # set after preclaimed:
         self.preclaimed_block_height = None
+        # the height of the block including the pre-claim, set once it is known
+        self.preclaimed_tx_block_height = None
         self.preclaimed_tx_hash = None
         self.preclaimed_commitment_hash = None
         self.preclaim_salt = None
@@ -39,11 +60,16 @@ class AEName:
         return f"{self.domain}:{self.name_id}"
 
     @classmethod
-    def validate_pointer(cls, pointer):
+    def validate_pointer(cls, pointer) -> bool:
+        """
+        Check if a pointer target is a valid account, oracle or contract address or an AENS name
+        :param pointer: the pointer target to validate
+        :return: true if it is valid false otherwise
+        """
         return (
-            not cls.validate_address(pointer, raise_exception=False)
+            utils.is_valid_hash(pointer, prefix=[identifiers.ACCOUNT_ID, identifiers.ORACLE_ID, identifiers.CONTRACT_ID])
             or
-            not cls.validate_name(pointer, raise_exception=False)
+            utils.is_valid_aens_name(pointer)
         )
 
     @classmethod
@@ -89,6 +115,53 @@ class AEName:
             return defaults.NAME_BID_TIMEOUTS.get(8) + claim_height
         return claim_height
 
+    @classmethod
+    def get_claimable(cls, names: list, current_height: int) -> list:
+        """
+        Select the pre-claimed names that have enough confirmations to be claimed,
+        useful to check many pending pre-claims retrieving the chain height only once.
+        Only the names for which the pre-claim has been seen mined are considered, use
+        update_preclaimed_heights to retrieve the heights of the pending pre-claims.
+        :param names: the list of AEName to check
+        :param current_height: the current key block height
+        :return: the list of names that can be claimed
+        """
+        return [
+            n for n in names
+            if n.status == NameStatus.PRECLAIMED
+            and n.preclaimed_tx_block_height is not None
+            and current_height >= n.preclaimed_tx_block_height + n.client.config.key_block_confirmation_num
+        ]
+
+    @classmethod
+    def update_preclaimed_heights(cls, names: list, max_workers: int = 8):
+        """
+        Retrieve concurrently the height of the block including the pre-claim
+        for the pre-claimed names where it is not known yet,
+        the names with a pre-claim not yet mined (or not found) are left unchanged.
+        :param names: the list of AEName to update
+        :param max_workers: the maximum number of concurrent requests to the node
+        """
+        pending = [
+            n for n in names
+            if n.status == NameStatus.PRECLAIMED
+            and n.preclaimed_tx_hash is not None
+            and n.preclaimed_tx_block_height is None
+        ]
+        if len(pending) == 0:
+            return
+
+        def _get_height(name):
+            try:
+                return name.client.get_transaction_by_hash(hash=name.preclaimed_tx_hash).block_height
+            except OpenAPIClientException:
+                return -1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for name, height in zip(pending, executor.map(_get_height, pending)):
+                if height > 0:
+                    name.preclaimed_tx_block_height = height
+
     def _get_pointers(self, targets):
         """
         Create a list of pointers given a list of addresses
@@ -142,7 +215,7 @@ class AEName:
 
         It executes:
         1. pre-claim
-        2. claim
+        2. claim (retried with an exponential backoff if the pre-claim is not confirmed yet)
         3. pointers update
 
         :param account: the account registering the name
@@ -156,25 +229,35 @@ class AEName:
         # set the blocking to true
         blocking_orig = self.client.config.blocking_mode
         self.client.config.blocking_mode = True
-        #
-        if not self.is_available():
-            raise NameNotAvailable(self.domain)
-        hashes = {}
-        # run pre-claim
-        tx = self.preclaim(account)
-        hashes['preclaim_tx'] = tx
-        # wait for the block confirmation
-        self.client.wait_for_confirmation(tx.hash)
-        # run claim
-        tx = self.claim(tx.hash, account, tx.metadata.salt)
-        # wait for the block confirmation
-        self.client.wait_for_confirmation(tx.hash)
-        hashes['claim_tx'] = tx
-        # run update
-        tx = self.update(account, *targets, name_ttl=name_ttl, client_ttl=client_ttl)
-        hashes['update_tx'] = tx
-        # restore blocking value
-        self.client.config.blocking_mode = blocking_orig
+        try:
+            if not self.is_available():
+                raise NameNotAvailable(self.domain)
+            hashes = {}
+            # run pre-claim
+            preclaim_tx = self.preclaim(account)
+            hashes['preclaim_tx'] = preclaim_tx
+            # wait for the block confirmation
+            self.preclaimed_tx_block_height = self.client.wait_for_confirmation(preclaim_tx.hash)
+            # run claim, retry if the node does not consider the pre-claim confirmed yet
+            for attempt in range(defaults.NAME_CLAIM_MAX_RETRIES + 1):
+                try:
+                    tx = self.claim(preclaim_tx.hash, account, preclaim_tx.metadata.salt)
+                    break
+                except NameTooEarlyClaim:
+                    if attempt == defaults.NAME_CLAIM_MAX_RETRIES:
+                        raise
+                    # backoff exponentially before checking the confirmations again
+                    time.sleep(min(2 ** attempt, self.client.config.poll_block_retries_interval))
+                    self.preclaimed_tx_block_height = self.client.wait_for_confirmation(preclaim_tx.hash)
+            # wait for the block confirmation
+            self.client.wait_for_confirmation(tx.hash)
+            hashes['claim_tx'] = tx
+            # run update
+            tx = self.update(account, *targets, name_ttl=name_ttl, client_ttl=client_ttl)
+            hashes['update_tx'] = tx
+        finally:
+            # restore blocking value
+            self.client.config.blocking_mode = blocking_orig
         return hashes
 
     def preclaim(self, account, fee=defaults.FEE, tx_ttl=defaults.TX_TTL) -> transactions.TxObject:
@@ -190,23 +273,32 @@ class AEName:
         """
         # parse the fee
         fee = utils.amount_to_aettos(fee)
+        address = account.get_address()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # get the ttl, it includes the current height used to create the pre-claim
+            ttl = executor.submit(self.client.compute_absolute_ttl, tx_ttl)
+            # get the account nonce
+            nonce = executor.submit(self.client.get_next_nonce, address)
+            # calculate the commitment id while waiting, keep it around to verify the claim
+            self.preclaim_salt = hashing.randint()
+            commitment_id = hashing._commitment_id(self._domain_bytes, self.preclaim_salt)
+            self.preclaimed_commitment_hash = commitment_id
+            ttl, nonce = ttl.result(), nonce.result()
         # check which block we used to create the pre-claim
-        self.preclaimed_block_height = self.client.get_current_key_block_height()
-        # calculate the commitment id
-        commitment_id, self.preclaim_salt = hashing.commitment_id(self.domain)
+        self.preclaimed_block_height = ttl.height
+        ttl = ttl.absolute_ttl
         # get the transaction builder
         txb = self.client.tx_builder
-        # get the account nonce and ttl
-        nonce, ttl = self.client._get_nonce_ttl(account.get_address(), tx_ttl)
         # create spend_tx
-        tx = txb.tx_name_preclaim(account.get_address(), commitment_id, fee, ttl, nonce)
+        tx = txb.tx_name_preclaim(address, commitment_id, fee, ttl, nonce)
         # sign the transaction
         tx_signed = self.client.sign_transaction(account, tx, metadata={"salt": self.preclaim_salt})
         # post the transaction to the chain
         self.client.broadcast_transaction(tx_signed)
         # update local status
         self.status = AEName.Status.PRECLAIMED
-        self.preclaim_tx_hash = tx_signed.hash
+        self.preclaimed_tx_hash = tx_signed.hash
+        self.preclaimed_tx_block_height = None
         return tx_signed
 
     def claim(self, preclaim_tx_hash, account, name_salt,
@@ -231,39 +323,49 @@ class AEName:
         :raises NameTooEarlyClaim: if the pre-claim transaction has not been confirmed yet
         :raises TypeError: if the value of the name_fee is not sufficient to successfully execute the claim
         """
+        # reuse the commitment id computed during the pre-claim if the salt is the same
+        commitment_id = self.preclaimed_commitment_hash
+        if commitment_id is None or name_salt != self.preclaim_salt:
+            commitment_id = hashing._commitment_id(self._domain_bytes, name_salt)
+            self.preclaimed_commitment_hash = commitment_id
         self.preclaim_salt = name_salt
         # parse the amounts
         name_fee, fee = utils._amounts_to_aettos(name_fee, fee)
-        # get the pre-claim height
-        try:
-            pre_claim_tx = self.client.get_transaction_by_hash(hash=preclaim_tx_hash)
-            self.preclaimed_block_height = pre_claim_tx.block_height
-        except OpenAPIClientException:
-            raise MissingPreclaim(f"Pre-claim transaction {preclaim_tx_hash} not found")
+        address = account.get_address()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # get the ttl, it includes the current height
+            ttl = executor.submit(self.client.compute_absolute_ttl, tx_ttl)
+            # get the account nonce
+            nonce = executor.submit(self.client.get_next_nonce, address)
+            # get the pre-claim height
+            try:
+                pre_claim_tx = executor.submit(self.client.get_transaction_by_hash, hash=preclaim_tx_hash).result()
+                self.preclaimed_block_height = pre_claim_tx.block_height
+            except OpenAPIClientException:
+                raise MissingPreclaim(f"Pre-claim transaction {preclaim_tx_hash} not found")
+            ttl, nonce = ttl.result(), nonce.result()
+        current_height = ttl.height
+        ttl = ttl.absolute_ttl
         # if the commitment_id mismatch
         pre_claim_commitment_id = pre_claim_tx.tx.commitment_id
-        commitment_id, _ = hashing.commitment_id(self.domain, salt=name_salt)
         if pre_claim_commitment_id != commitment_id:
             raise NameCommitmentIdMismatch(f"Commitment id mismatch, wanted {pre_claim_commitment_id} got {commitment_id}")
         # if the transaction has not been mined
         if self.preclaimed_block_height <= 0:
             raise NameTooEarlyClaim(f"The pre-claim transaction has not been mined yet")
-        # get the current height
-        current_height = self.client.get_current_key_block_height()
+        self.preclaimed_tx_block_height = self.preclaimed_block_height
         safe_height = self.preclaimed_block_height + self.client.config.key_block_confirmation_num
         if current_height < safe_height:
             raise NameTooEarlyClaim(f"It is not safe to execute the name claim before height {safe_height}, current height: {current_height}")
         # get the transaction builder
         txb = self.client.tx_builder
-        # get the account nonce and ttl
-        nonce, ttl = self.client._get_nonce_ttl(account.get_address(), tx_ttl)
         # create transaction
         # check the protocol version
         min_name_fee = AEName.get_minimum_name_fee(self.domain)
         if name_fee != defaults.NAME_FEE and name_fee < min_name_fee:
             raise TypeError(f"the provided fee {name_fee} is not enough to execute the claim, required: {min_name_fee}")
         name_fee = max(min_name_fee, name_fee)
-        tx = txb.tx_name_claim_v2(account.get_address(), self.domain, self.preclaim_salt, name_fee, fee, ttl, nonce)
+        tx = txb.tx_name_claim_v2(address, self.domain, self.preclaim_salt, name_fee, fee, ttl, nonce)
         # sign the transaction
         tx_signed = self.client.sign_transaction(account, tx)
         # post the transaction to the chain
@@ -294,9 +396,10 @@ class AEName:
         # parse amounts
         bid_fee, fee = utils._amounts_to_aettos(bid_fee, fee)
         # get the account nonce and ttl
-        nonce, ttl = self.client._get_nonce_ttl(account.get_address(), tx_ttl)
+        address = account.get_address()
+        nonce, ttl = self.client._get_nonce_ttl(address, tx_ttl)
         # check the protocol version
-        tx = txb.tx_name_claim_v2(account.get_address(), self.domain, 0, bid_fee, fee, ttl, nonce)
+        tx = txb.tx_name_claim_v2(address, self.domain, 0, bid_fee, fee, ttl, nonce)
         # sign the transaction
         tx_signed = self.client.sign_transaction(account, tx)
         # post the transaction to the chain
@@ -335,9 +438,10 @@ class AEName:
         # get the transaction builder
         txb = self.client.tx_builder
         # get the account nonce and ttl
-        nonce, ttl = self.client._get_nonce_ttl(account.get_address(), tx_ttl)
+        address = account.get_address()
+        nonce, ttl = self.client._get_nonce_ttl(address, tx_ttl)
         # create transaction
-        tx = txb.tx_name_update(account.get_address(), self.name_id, pointers, name_ttl, client_ttl, fee, ttl, nonce)
+        tx = txb.tx_name_update(address, self.name_id, pointers, name_ttl, client_ttl, fee, ttl, nonce)
         # sign the transaction
         tx_signed = self.client.sign_transaction(account, tx)
         # post the transaction to the chain
@@ -364,9 +468,10 @@ class AEName:
         # parse amounts
         fee = utils.amount_to_aettos(fee)
         # get the account nonce and ttl
-        nonce, ttl = self.client._get_nonce_ttl(account.get_address(), tx_ttl)
+        address = account.get_address()
+        nonce, ttl = self.client._get_nonce_ttl(address, tx_ttl)
         # create transaction
-        tx = txb.tx_name_transfer(account.get_address(), self.name_id, recipient_id, fee, ttl, nonce)
+        tx = txb.tx_name_transfer(address, self.name_id, recipient_id, fee, ttl, nonce)
         # sign the transaction
         tx_signed = self.client.sign_transaction(account, tx)
         # post the transaction to the chain
@@ -392,9 +497,10 @@ class AEName:
         # get the transaction builder
         txb = self.client.tx_builder
         # get the account nonce and ttl
-        nonce, ttl = self.client._get_nonce_ttl(account.get_address(), tx_ttl)
+        address = account.get_address()
+        nonce, ttl = self.client._get_nonce_ttl(address, tx_ttl)
         # create transaction
-        tx = txb.tx_name_revoke(account.get_address(), self.name_id, fee, ttl, nonce)
+        tx = txb.tx_name_revoke(address, self.name_id, fee, ttl, nonce)
         # sign the transaction
         tx_signed = self.client.sign_transaction(account, tx)
         # post the transaction to the chain
@@ -43,6 +43,7 @@ GA_ACCOUNTS_NONCE = 0  # for tx in ga transactions the nonce must be 0
 NAME_MAX_TTL = 50000  # in blocks
 NAME_MAX_CLIENT_TTL = 84600  # in seconds
 NAME_FEE = 0
+NAME_CLAIM_MAX_RETRIES = 3  # claim retries in full_claim_blocking if the pre-claim is not confirmed yet
 # see https://github.com/aeternity/aeternity/blob/72e440b8731422e335f879a31ecbbee7ac23a1cf/apps/aecore/src/aec_governance.erl#L67
 NAME_FEE_MULTIPLIER = 100000000000000
 NAME_FEE_BID_INCREMENT = 0.05  # the increment is in percentage
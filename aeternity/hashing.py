@@ -1,15 +1,17 @@
-import base58
 import base64
 import hashlib
 import rlp
 import secrets
 import math
 
-from nacl.hash import blake2b
-from nacl.encoding import RawEncoder
-
 from aeternity import identifiers
 
+try:
+    # use the native implementation if available (pip install aepp-sdk[speedups])
+    import based58 as base58
+except ImportError:
+    import base58
+
 
 def _base58_encode(data):
     """create a base58 encoded string with checksum"""
@@ -18,7 +20,11 @@ def _base58_encode(data):
 
 def _base58_decode(encoded_str):
     """decode a base58 with checksum string to bytes"""
-    return base58.b58decode_check(encoded_str)
+    if isinstance(encoded_str, str):
+        # the native implementation accepts only bytes
+        encoded_str = encoded_str.encode("ascii")
+    # strip the trailing whitespaces like the pure python implementation does
+    return base58.b58decode_check(encoded_str.rstrip())
 
 
 def _checksum(data: bytes) -> bytes:
@@ -52,7 +58,7 @@ def _base64_decode(encoded_str: str) -> bytes:
 
 def _blake2b_digest(data):
     """create a blake2b 32 bit raw encoded digest"""
-    return blake2b(data=data, digest_size=32, encoder=RawEncoder)
+    return hashlib.blake2b(data, digest_size=32).digest()
 
 
 def _sha256(data):
@@ -170,8 +176,14 @@ def commitment_id(domain: str, salt: int = None) -> tuple:
         a tuple containing the commitment_id and the salt used to generate the commitment_id
     """
     name_salt = randint() if salt is None else salt
-    commitment_id = hash_encode(identifiers.COMMITMENT_ID, domain.lower().encode('utf8') + _int(name_salt, 32))
-    return commitment_id, name_salt
+    return _commitment_id(domain.lower().encode('utf8'), name_salt), name_salt
+
+
+def _commitment_id(name: bytes, salt: int) -> str:
+    """
+    Compute the commitment id from the already encoded (lowercase) domain and the salt
+    """
+    return hash_encode(identifiers.COMMITMENT_ID, name + _int(salt, 32))
 
 
 def _int(val: int, byte_length: int = None) -> bytes:
@@ -312,6 +324,10 @@ def randint(upper_bound: int = 2**64):
     Returns:
         a random number
     """
+    if upper_bound > 1 and upper_bound & (upper_bound - 1) == 0:
+        # for powers of 2 (like the default) take the bits directly, randbelow
+        # would draw one extra bit and discard half of the results
+        return secrets.randbits(upper_bound.bit_length() - 1)
     return secrets.randbelow(upper_bound)
 
 
@@ -43,8 +43,8 @@ class Config:
             :key_block_confirmation_num (int): the number of key blocks to consider a transaction confirmed
             :poll_tx_max_retries (int): max poll retries when checking if a transaction has been included
             :poll_tx_retries_interval (int): the interval in seconds between retries
-            :poll_block_max_retries (int): TODO
-            :poll_block_retries_interval (int): TODO
+            :poll_block_max_retries (int): the max number of polls (at the full interval) when waiting for a transaction confirmation
+            :poll_block_retries_interval (int): the max interval in seconds between polls when waiting for a transaction confirmation
             :offline (bool): whenever the node should not contact the node for any information
             :debug (bool): enable debug logging for api calls
 
@@ -418,11 +418,13 @@ class NodeClient:
         """
         Wait for a transaction to be confirmed by at least "key_block_confirmation_num" blocks (default 3)
         The amount of blocks can be configured in the Config object using key_block_confirmation_num parameter
+        The chain height is polled with an exponential backoff capped at polling_interval,
+        the wait is aborted after (max_retries - 1) * polling_interval seconds
 
         Args:
             tx (TxObject|str): the TxObject or transaction hash of the transaction to wait for
             max_retries (int): the maximum number of retries to test for transaction
-            polling_interval (int): the interval between transaction polls
+            polling_interval (int): the maximum interval between transaction polls
         Returns:
             the block height of the transaction if it has been found
         Raises:
@@ -438,19 +440,22 @@ class NodeClient:
         interval = polling_interval if polling_interval is not None else self.config.poll_block_retries_interval
         if retries <= 0 or interval <= 0:
             raise ValueError("max_retries and polling_interval must be greater than 0")
-        # start polling
-        n = 1
+        # start polling, the maximum wait time is (retries - 1) * interval
+        max_sleep = (retries - 1) * interval
+        n = 0
         total_sleep = 0
         while True:
             current_height = self.get_current_key_block_height()
             # if the tx.block_height >= min_block_height we are ok
             if current_height >= min_block_height:
                 break
-            if n >= retries:
+            if total_sleep >= max_sleep:
                 raise TransactionWaitTimeoutExpired(tx_hash=tx_hash, reason=f"The transaction was not included in {total_sleep} seconds, wait aborted")
-            # calculate sleep time
-            time.sleep(interval)
-            total_sleep += interval
+            # calculate sleep time: start polling fast (for short key block intervals)
+            # and backoff exponentially up to the polling interval
+            sleep_time = min(2 ** n, interval, max_sleep - total_sleep)
+            time.sleep(sleep_time)
+            total_sleep += sleep_time
             # increment n
             n += 1
         return tx_height
@@ -10,6 +10,12 @@ import semver
 
 import simplejson
 
+try:
+    # use the native json implementation if available (pip install aepp-sdk[speedups])
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class OpenAPIArgsException(Exception):
     """Raised when there is an error in method arguments"""
@@ -51,8 +57,10 @@ class OpenAPICli(object):
         try:
             self.url, self.url_internal = url, url_internal
             self.skip_tags = set(["obsolete"])
+            # reuse the connections to the node across api calls
+            self.session = requests.Session()
             # load the openapi json file from the node
-            api_reply = requests.get(f"{url}/api")
+            api_reply = self.session.get(f"{url}/api")
             self.api_def = api_reply.json()
             if self.api_def.get('api') is not None:  # TODO: workaround for different swagger styles
                 self.api_def = self.api_def.get('api', {})
@@ -201,13 +209,17 @@ class OpenAPICli(object):
                     post_body = val
             # make the request
             if api.http_method == 'get':
-                http_reply = requests.get(target_endpoint, params=query_params)
+                http_reply = self.session.get(target_endpoint, params=query_params)
                 api_response = api.responses.get(http_reply.status_code, None)
-                self.logger.debug(f"GET {target_endpoint}, params:{query_params} --> {http_reply.text}")
+                # avoid decoding the reply text if debug is not enabled
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"GET {target_endpoint}, params:{query_params} --> {http_reply.text}")
             else:
-                http_reply = requests.post(target_endpoint, params=query_params, json=post_body)
+                http_reply = self.session.post(target_endpoint, params=query_params, data=self._json_dumps(post_body),
+                                               headers={"Content-Type": "application/json"})
                 api_response = api.responses.get(http_reply.status_code, None)
-                self.logger.debug(f"POST {target_endpoint}, params:{query_params}, body: {post_body} --> {http_reply.text}", )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"POST {target_endpoint}, params:{query_params}, body: {post_body} --> {http_reply.text}", )
             # unknown error
             if api_response is None:
                 raise OpenAPIClientException(f"Unknown error {target_endpoint} {http_reply.status_code} - {http_reply.text}", code=http_reply.status_code)
@@ -230,6 +242,16 @@ class OpenAPICli(object):
         setattr(self, api_method.__name__, api_method)
         self.api_methods.append(api)
 
+    def _json_dumps(self, body) -> bytes:
+        """serialize a request body to json"""
+        if orjson is not None:
+            try:
+                return orjson.dumps(body)
+            except TypeError:
+                # orjson does not support integers larger than 64 bit (eg. aettos amounts)
+                pass
+        return simplejson.dumps(body).encode("utf-8")
+
     def _is_valid_interval(self, val, field):
         is_ok = True
         if not isinstance(val, int):
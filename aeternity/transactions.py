@@ -401,6 +401,9 @@ class TxObject:
         self.set_data(kwargs.get("data", {}))
         self.tx = kwargs.get("tx", None)
         self.hash = kwargs.get("hash", None)
+        # keep the rlp bytes of the encoded tx (if known) to avoid decoding it again
+        rlp_tx = kwargs.get("rlp", None)
+        self._rlp = (self.tx, rlp_tx) if rlp_tx is not None else None
         self.set_metadata(kwargs.get("metadata", {}))
         # self._build_index() # the index building is triggered by the set metadata
 
@@ -438,6 +441,17 @@ class TxObject:
 
         return t
 
+    def get_rlp(self) -> bytes:
+        """
+        Get the rlp encoded bytes of the transaction.
+        The encoded tx is decoded only if the bytes are not already known
+
+        :return: the rlp bytes of the transaction
+        """
+        if self._rlp is None or self._rlp[0] != self.tx:
+            self._rlp = (self.tx, decode(self.tx))
+        return self._rlp[1]
+
     def get(self, name):
         """
         Get the value of a property of the transaction by name,
@@ -524,7 +538,7 @@ class TxSigner:
             the encoded and prefixed signature
         """
         # get the transaction as byte list
-        tx_raw = decode(transaction.tx)
+        tx_raw = transaction.get_rlp()
         # sign the transaction
         signature = self.account.sign(_binary(self.network_id) + tx_raw)
         # pack and encode the transaction
@@ -665,7 +679,10 @@ class TxBuilder:
         compute_hash = True if tag == idf.OBJECT_TAG_SIGNED_TRANSACTION else False
         return self._txdata_to_txobject(tx_data, descriptor, compute_hash=compute_hash)
 
-    def _txdata_to_txobject(self, data: dict, descriptor: dict, metadata: dict = {}, compute_hash=True) -> TxObject:
+    def _txdata_to_rlp_raw(self, data: dict, descriptor: dict) -> list:
+        """
+        Encode the transaction fields to the list to be serialized in rlp
+        """
         # initialize the right data size
         # this is PYTHON to POSTBODY
         schema = descriptor.get("schema", [])
@@ -696,8 +713,15 @@ class TxBuilder:
                 raw_data[fn.index] = [[_binary(p.get("key")), _id(p.get("id"))] for p in data.get(label, [])]
             elif fn.field_type == _TX:
                 # this can be raw or tx object
-                tx = data.get(label).tx if hasattr(data.get(label), "tx") else data.get(label)
-                raw_data[fn.index] = decode(tx)
+                tx = data.get(label)
+                raw_data[fn.index] = tx.get_rlp() if isinstance(tx, TxObject) else decode(tx.tx if hasattr(tx, "tx") else tx)
+        return raw_data
+
+    def _txdata_to_txobject(self, data: dict, descriptor: dict, metadata: dict = {}, compute_hash=True,
+                            raw_data: list = None, min_fee: int = None) -> TxObject:
+        # the raw data and the min fee can be passed if they are already known
+        if raw_data is None:
+            raw_data = self._txdata_to_rlp_raw(data, descriptor)
         # encode the transaction in rlp
         rlp_tx = rlp.encode(raw_data)
         # encode the tx in base64
@@ -708,6 +732,7 @@ class TxBuilder:
         txo = TxObject(
             data=Munch.fromDict(tx_data),
             tx=rlp_b64_tx,
+            rlp=rlp_tx,
         )
         # compute the tx hash
         if compute_hash:
@@ -716,7 +741,7 @@ class TxBuilder:
         tx_meta = copy.deepcopy(metadata) if metadata is not None else {}
         # compute the minimum fee
         if descriptor.get("fee") is not None:
-            tx_meta["min_fee"] = self.compute_min_fee(data, descriptor, raw_data)
+            tx_meta["min_fee"] = min_fee if min_fee is not None else self.compute_min_fee(data, descriptor, raw_data)
         # only set the metadata if it is not empty
         txo.set_metadata(tx_meta)
         return txo
@@ -782,14 +807,16 @@ class TxBuilder:
         if descriptor is None:
             # the transaction is not defined
             raise TypeError(f"Unknown transaction tag/version: {tag}/{vsn}")
-        # build the tx object
-        txo = self._txdata_to_txobject(tx_data, descriptor, metadata=metadata)
         # check whenever we need to automatically assign the fee
         # we use -1 as default since for the signed tx there is no field fee
         if tx_data.get("fee", -1) == 0:
-            tx_data["fee"] = txo.metadata.min_fee
-            txo = self._txdata_to_txobject(tx_data, descriptor, metadata)
-        return txo
+            # only the rlp fields are needed to compute the fee,
+            # compute_min_fee sets the final fee in the raw data that is then reused
+            raw_data = self._txdata_to_rlp_raw(tx_data, descriptor)
+            tx_data["fee"] = self.compute_min_fee(tx_data, descriptor, raw_data)
+            return self._txdata_to_txobject(tx_data, descriptor, metadata=metadata, raw_data=raw_data, min_fee=tx_data["fee"])
+        # build the tx object
+        return self._txdata_to_txobject(tx_data, descriptor, metadata=metadata)
 
     def parse_node_reply(self, tx_data) -> TxObject:
         """
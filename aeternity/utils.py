@@ -16,21 +16,15 @@ def is_valid_hash(hash_str: str, prefix: str = None) -> bool:
     try:
         if hash_str is None:
             return False
+        # check the prefix first since is cheaper than decoding the hash
+        if prefix is not None:
+            if not isinstance(prefix, list):
+                prefix = [prefix]
+            # if a match is not found then is not valid
+            if not any(prefix_match(p, hash_str) for p in prefix):
+                return False
         # decode the hash
         hashing.decode(hash_str)
-        # if prefix is not set then is valid
-        if prefix is None:
-            return True
-        # let's check the prefix
-        if not isinstance(prefix, list):
-            prefix = [prefix]
-        # if a match is not found then raise ValueError
-        match = False
-        for p in prefix:
-            match = match or prefix_match(p, hash_str)
-        if not match:
-            raise ValueError('Invalid prefix')
-        # a match was found
         return True
     except ValueError:
         return False
@@ -50,8 +44,8 @@ def is_valid_aens_name(domain_name):
     """
     Test if the provided name is valid for the aens system
     """
-    if domain_name is None or not validators.domain(domain_name.lower()) or (
-            not domain_name.endswith(('.chain')) and not domain_name.endswith(('.test'))):
+    # check the tld before running the (more expensive) domain validation
+    if domain_name is None or not domain_name.endswith(('.chain', '.test')) or not validators.domain(domain_name.lower()):
         return False
     return True
 
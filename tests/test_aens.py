@@ -1,6 +1,10 @@
 from aeternity.aens import AEName
+from aeternity.exceptions import NameTooEarlyClaim
+from aeternity.openapi import OpenAPIClientException
+from aeternity import aens, defaults, transactions
 from tests.conftest import random_domain
 from aeternity.signing import Account
+from munch import Munch
 
 from pytest import raises, skip
 
@@ -17,6 +21,126 @@ def test_name_validation_succeeds(chain_fixture):
     chain_fixture.NODE_CLI.AEName('test.chain')
 
 
+def test_name_validate_pointer():
+    args = [
+        ('ak_me6L5SSXL4NLWv5EkQ7a16xaA145Br7oV4sz9JphZgsTsYwGC', True),
+        ('ok_me6L5SSXL4NLWv5EkQ7a16xaA145Br7oV4sz9JphZgsTsYwGC', True),
+        ('ct_me6L5SSXL4NLWv5EkQ7a16xaA145Br7oV4sz9JphZgsTsYwGC', True),
+        ('th_me6L5SSXL4NLWv5EkQ7a16xaA145Br7oV4sz9JphZgsTsYwGC', False),
+        ('ak_me6L5SSXL4NLWv5EkQ7a16xaA145Br7oV4sz9JphZgsTsYwYC', False),
+        ('aeternity.chain', True),
+        ('aeternity.com', False),
+        (None, False),
+    ]
+
+    for a in args:
+        assert AEName.validate_pointer(a[0]) == a[1]
+
+
+def test_name_get_claimable():
+    client = Munch.fromDict({"config": {"key_block_confirmation_num": 3}})
+    names = []
+    for status, height in [
+        (AEName.Status.PRECLAIMED, 10),
+        (AEName.Status.PRECLAIMED, 12),
+        (AEName.Status.PRECLAIMED, None),
+        (AEName.Status.CLAIMED, 10),
+        (AEName.Status.AVAILABLE, None),
+    ]:
+        name = AEName(random_domain(length=13), client)
+        name.status, name.preclaimed_tx_block_height = status, height
+        names.append(name)
+    # the height recorded before broadcasting the pre-claim is not enough
+    names[2].preclaimed_block_height = 1
+
+    assert AEName.get_claimable(names, 12) == []
+    assert AEName.get_claimable(names, 13) == names[0:1]
+    assert AEName.get_claimable(names, 15) == names[0:2]
+
+
+def test_name_update_preclaimed_heights():
+    mined = {}
+
+    def get_transaction_by_hash(hash):
+        if hash not in mined:
+            raise OpenAPIClientException("Transaction not found", code=404)
+        return Munch(block_height=mined[hash])
+
+    txs = iter(range(100))
+    client = Munch(
+        config=Munch(key_block_confirmation_num=3, blocking_mode=False),
+        tx_builder=transactions.TxBuilder(),
+        compute_absolute_ttl=lambda ttl: Munch(height=10, absolute_ttl=0),
+        get_next_nonce=lambda address: 1,
+        sign_transaction=lambda account, tx, metadata: Munch(hash=f"th_{next(txs)}", metadata=metadata),
+        broadcast_transaction=lambda tx: tx.hash,
+        get_transaction_by_hash=get_transaction_by_hash,
+    )
+    account = Account.generate()
+    names = [AEName(random_domain(length=13), client) for _ in range(3)]
+    txs_hashes = [n.preclaim(account).hash for n in names]
+    # the pre-claims have not been mined
+    AEName.update_preclaimed_heights(names)
+    assert AEName.get_claimable(names, 100) == []
+    # the first is mined, the second is pending and the third not found
+    mined[txs_hashes[0]] = 11
+    mined[txs_hashes[1]] = -1
+    AEName.update_preclaimed_heights(names)
+    assert [n.preclaimed_tx_block_height for n in names] == [11, None, None]
+    assert AEName.get_claimable(names, 13) == []
+    assert AEName.get_claimable(names, 14) == names[0:1]
+    # already known heights are not requested again
+    mined[txs_hashes[0]] = 99
+    mined[txs_hashes[1]] = 12
+    AEName.update_preclaimed_heights(names)
+    assert [n.preclaimed_tx_block_height for n in names] == [11, 12, None]
+    assert AEName.get_claimable(names, 15) == names[0:2]
+
+
+def test_name_full_claim_blocking_retries(monkeypatch):
+    sleeps, waits, attempts = [], [], []
+    client = Munch(
+        config=Munch(key_block_confirmation_num=3, blocking_mode=False, poll_block_retries_interval=3),
+        wait_for_confirmation=lambda tx_hash: waits.append((tx_hash, client.config.blocking_mode)) or 10,
+    )
+
+    def claim(self, preclaim_tx_hash, account, name_salt):
+        attempts.append(client.config.blocking_mode)
+        if len(attempts) <= too_early:
+            raise NameTooEarlyClaim("too early")
+        return Munch(hash="th_claim")
+
+    monkeypatch.setattr(defaults, "NAME_CLAIM_MAX_RETRIES", 3)
+    monkeypatch.setattr(aens.time, "sleep", sleeps.append)
+    monkeypatch.setattr(AEName, "is_available", lambda self: True)
+    monkeypatch.setattr(AEName, "preclaim", lambda self, account: Munch(hash="th_preclaim", metadata=Munch(salt=1)))
+    monkeypatch.setattr(AEName, "claim", claim)
+    monkeypatch.setattr(AEName, "update", lambda self, account, *targets, **kwargs: Munch(hash="th_update"))
+    account = Account.generate()
+
+    # the claim succeeds at the last attempt
+    too_early = defaults.NAME_CLAIM_MAX_RETRIES
+    hashes = AEName(random_domain(length=13), client).full_claim_blocking(account, account.get_address())
+    assert hashes["claim_tx"].hash == "th_claim"
+    assert attempts == [True] * (defaults.NAME_CLAIM_MAX_RETRIES + 1)
+    # exponential backoff capped by the polling interval
+    assert sleeps == [1, 2, 3]
+    # the confirmations are checked again before each retry
+    assert waits == [("th_preclaim", True)] * (defaults.NAME_CLAIM_MAX_RETRIES + 1) + [("th_claim", True)]
+    assert client.config.blocking_mode is False
+
+    # the claim is never accepted
+    sleeps.clear()
+    waits.clear()
+    attempts.clear()
+    too_early = defaults.NAME_CLAIM_MAX_RETRIES + 1
+    with raises(NameTooEarlyClaim):
+        AEName(random_domain(length=13), client).full_claim_blocking(account, account.get_address())
+    assert len(attempts) == defaults.NAME_CLAIM_MAX_RETRIES + 1
+    assert sleeps == [1, 2, 3]
+    assert client.config.blocking_mode is False
+
+
 def test_name_is_available(chain_fixture):
     domain = random_domain()
     name = chain_fixture.NODE_CLI.AEName(domain)
@@ -1,5 +1,6 @@
-from aeternity import hashing, transactions
+from aeternity import hashing, transactions, utils
 from pytest import raises
+import pytest
 
 
 def test_hashing_name_id():
@@ -94,6 +95,32 @@ def test_hashing_base58_encode():
             assert i.get("raise_error") is True
 
 
+@pytest.mark.parametrize("module", ["base58", "based58"])
+def test_hashing_base58_decode_backends(monkeypatch, module):
+    # the native and the pure python implementations must accept the same inputs
+    monkeypatch.setattr(hashing, "base58", pytest.importorskip(module))
+    tts = [
+        {"in": "LUC1eAJa5jW", "out": b"test", "err": False},
+        {"in": "97Wv2fcowb3y3qVnDC", "out": b"aeternity", "err": False},
+        {"in": b"97Wv2fcowb3y3qVnDC", "out": b"aeternity", "err": False},
+        {"in": "97Wv2fcowb3y3qVnDC\n", "out": b"aeternity", "err": False},
+        {"in": "97Wv2fcowb3y3qVnDC \t\n", "out": b"aeternity", "err": False},
+        {"in": " 97Wv2fcowb3y3qVnDC", "out": None, "err": True},
+        {"in": "97Wv2fcowb3y3qVnDD", "out": None, "err": True},  # bad checksum
+        {"in": "LUC1eAJa", "out": None, "err": True},  # bad checksum
+    ]
+    for tt in tts:
+        if tt["err"]:
+            with raises(ValueError):
+                hashing._base58_decode(tt["in"])
+        else:
+            assert hashing._base58_decode(tt["in"]) == tt["out"]
+    assert hashing._base58_encode(b"aeternity") == "97Wv2fcowb3y3qVnDC"
+    # trailing whitespaces in addresses are tolerated by both implementations
+    account_id = "ak_2iqfJjbhGgJFRezjX6Q6DrvokkTM5niGEHBEJZ7uAG5fSGJAw1"
+    assert utils.is_valid_hash(account_id + "\n", prefix="ak")
+
+
 def test_hashing_transactions_binary():
     tts = [
         {"in": "test", "bval": "test".encode("utf-8"), "match": True, "err": False},
@@ -178,3 +205,14 @@ def test_hashing_committment_id():
     for t in tests:
         cid, salt = hashing.commitment_id(t.get("domain"), t.get("salt"))
         assert t.get("commitment_id") == cid
+
+
+def test_hashing_randint():
+
+    for upper_bound in [1, 2, 10, 2**8, 2**64]:
+        for _ in range(100):
+            n = hashing.randint(upper_bound)
+            assert 0 <= n < upper_bound
+
+    with raises(ValueError):
+        hashing.randint(0)
@@ -1,5 +1,6 @@
 from aeternity.signing import Account
-from aeternity import defaults, identifiers, hashing, utils
+from aeternity import defaults, identifiers, hashing, utils, node
+from aeternity.exceptions import TransactionWaitTimeoutExpired
 import pytest
 import random
 # from aeternity.exceptions import TransactionNotFoundException
@@ -135,3 +136,45 @@ def test_node_ga_meta_spend(chain_fixture, compiler_fixture):
     print(f"GA_META_TX {tx_hash}")
     # check that the account received the tokens
     assert ae_cli.get_account_by_pubkey(pubkey=recipient_id).balance == amount
+
+
+def test_node_wait_for_confirmation(monkeypatch):
+    sleeps, heights = [], []
+
+    def get_current_key_block_height():
+        heights.append(heights[-1] + 1 if heights and mining else 10)
+        return heights[-1]
+
+    monkeypatch.setattr(node.time, "sleep", sleeps.append)
+    # a node client that does not connect to a node
+    client = object.__new__(node.NodeClient)
+    client.config = node.Config(key_block_confirmation_num=3, poll_block_max_retries=20, poll_block_retries_interval=30)
+    client.wait_for_transaction = lambda tx_hash: 10
+    client.get_current_key_block_height = get_current_key_block_height
+
+    # the transaction gets confirmed while polling
+    mining = True
+    assert client.wait_for_confirmation("th_tx") == 10
+    assert heights == [10, 11, 12, 13]
+    assert sleeps == [1, 2, 4]
+
+    # the chain does not progress: backoff up to the interval, abort after (max_retries - 1) * interval
+    sleeps.clear()
+    heights.clear()
+    mining = False
+    with pytest.raises(TransactionWaitTimeoutExpired):
+        client.wait_for_confirmation("th_tx")
+    assert sleeps == [1, 2, 4, 8, 16] + [30] * 17 + [29]
+    assert sum(sleeps) == 19 * 30
+    assert len(heights) == len(sleeps) + 1
+
+    # with a single retry it aborts after the first poll
+    sleeps.clear()
+    heights.clear()
+    with pytest.raises(TransactionWaitTimeoutExpired):
+        client.wait_for_confirmation("th_tx", max_retries=1)
+    assert heights == [10]
+    assert sleeps == []
+
+    with pytest.raises(ValueError):
+        client.wait_for_confirmation("th_tx", max_retries=0)
@@ -1,4 +1,5 @@
 import pytest
+import simplejson
 from aeternity.openapi import OpenAPICli
 from tests.conftest import NODE_URL, NODE_URL_DEBUG, PUBLIC_KEY
 
@@ -103,3 +104,22 @@ def test_generatedcli():
             except Exception as e:
                 if not s.get("wantErr"):
                     pytest.fail(f"{c.get('method')}/{s.get('name')} wantErr = false , got {e} ")
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_openapi_json_dumps(monkeypatch, native):
+    from aeternity import openapi
+    if not native:
+        monkeypatch.setattr(openapi, "orjson", None)
+    elif openapi.orjson is None:
+        pytest.skip("orjson not installed")
+    # the serializer does not need a node
+    cli = object.__new__(OpenAPICli)
+    body = {"recipient_id": PUBLIC_KEY, "amount": 100, "payload": "", "ttl": 0}
+    assert simplejson.loads(cli._json_dumps(body)) == body
+    # integers larger than 64 bits fall back to simplejson
+    body = {"recipient_id": PUBLIC_KEY, "amount": 2**70}
+    dumped = cli._json_dumps(body)
+    assert isinstance(dumped, bytes)
+    assert b"1180591620717411303424" in dumped
+    assert simplejson.loads(dumped) == body
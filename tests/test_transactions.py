@@ -168,3 +168,32 @@ def test_transaction_tx_object_spend():
     assert txo_from_str.meta("min_fee")     == meta_min_fee
 
 
+def test_transaction_tx_object_rlp():
+    account = Account.generate()
+    txbl = transactions.TxBuilder()
+    tx = txbl.tx_spend(account.get_address(), account.get_address(), 1000, "payload", 0, 0, 1)
+    # the rlp bytes are the decoded encoded tx
+    assert tx.get_rlp() == hashing.decode(tx.tx)
+    # the object is still consistent if the encoded tx changes
+    other = txbl.tx_spend(account.get_address(), account.get_address(), 2000, "payload", 0, 0, 1)
+    tx.tx = other.tx
+    assert tx.get_rlp() == hashing.decode(other.tx)
+    # wrapping it in a signed transaction gives the same result as parsing it from string
+    signature = transactions.TxSigner(account, idf.NETWORK_ID_TESTNET).sign_transaction(other)
+    signed = txbl.tx_signed([signature], other)
+    assert signed.tx == txbl.tx_signed([signature], txbl.parse_tx_string(other.tx)).tx
+
+
+def test_transaction_tx_object_auto_fee():
+    sender_id = Account.generate().get_address()
+    recipient_id = Account.generate().get_address()
+    txbl = transactions.TxBuilder()
+    for ttl in [0, 100000]:
+        # the fee computed automatically (fee = 0)
+        tx_auto = txbl.tx_spend(sender_id, recipient_id, 10**21, "payload", 0, ttl, 1)
+        # the same transaction with the minimum fee set explicitly
+        tx_explicit = txbl.tx_spend(sender_id, recipient_id, 10**21, "payload", tx_auto.data.fee, ttl, 1)
+        assert tx_auto.data.fee == tx_auto.meta("min_fee")
+        assert tx_auto.tx == tx_explicit.tx
+        assert tx_auto.hash == tx_explicit.hash
+        assert tx_auto.meta("min_fee") == tx_explicit.meta("min_fee")